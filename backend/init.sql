@@ -1,6 +1,6 @@
--- Create hands table
+-- Create hands table, partitioned by month on created_at
 CREATE TABLE IF NOT EXISTS hands (
-    id UUID PRIMARY KEY,
+    id UUID NOT NULL,
     stacks JSONB NOT NULL,
     dealer_position INTEGER NOT NULL,
     small_blind_position INTEGER NOT NULL,
@@ -9,8 +9,18 @@ CREATE TABLE IF NOT EXISTS hands (
     actions TEXT NOT NULL,
     board_cards TEXT,
     payoffs JSONB NOT NULL,
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-);
+    pot_size INTEGER,
+    street_reached TEXT,
+    winner_seats JSONB,
+    action_opcodes TEXT,
+    went_to_showdown BOOLEAN,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (id, created_at)
+) PARTITION BY RANGE (created_at);
+
+-- Catch-all for rows outside every monthly partition; monthly partitions
+-- (hands_YYYY_MM) are created by init_db and on demand by the repository
+CREATE TABLE IF NOT EXISTS hands_default PARTITION OF hands DEFAULT;
 
 -- Create index for faster queries
-CREATE INDEX IF NOT EXISTS idx_hands_created_at ON hands(created_at DESC);
\ No newline at end of file
+CREATE INDEX IF NOT EXISTS idx_hands_created_at ON hands(created_at DESC);
@@ -5,11 +5,11 @@ from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field
 
 from src.domain.hand import Hand
-from src.repository.hand_repository import HandRepository
+from src.repository import get_hand_repository
 from src.api.poker_calculator import calculate_payoffs
 
 router = APIRouter()
-repository = HandRepository()
+repository = get_hand_repository()
 
 class CreateHandRequest(BaseModel):
     """Request model for creating a hand."""
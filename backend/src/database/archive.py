@@ -0,0 +1,293 @@
+import argparse
+import bisect
+import json
+import logging
+import mmap
+import os
+import struct
+import time
+import zlib
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional
+from uuid import UUID
+
+from psycopg2.errors import LockNotAvailable
+from psycopg2.extensions import connection as Connection
+
+from src.database.connection import get_db_connection
+from src.database.partitions import add_months, current_month, list_partitions
+
+
+logger = logging.getLogger(__name__)
+
+
+# Archive file layout:
+#   MAGIC
+#   zlib-compressed JSON blocks of up to BLOCK_SIZE rows each
+#   id index:    record_count x (16-byte UUID, block number), sorted by UUID
+#   block table: block_count x (offset, length)
+#   footer:      (index offset, record_count, block_count, MAGIC)
+MAGIC = b"HANDARC1"
+BLOCK_SIZE = 512
+ARCHIVE_SUFFIX = ".arc"
+
+# How long archival waits for a table lock before backing off and retrying
+LOCK_TIMEOUT = "5s"
+LOCK_ATTEMPTS = 5
+LOCK_RETRY_DELAY = 10.0
+
+_INDEX_ENTRY = struct.Struct("<16sI")
+_BLOCK_ENTRY = struct.Struct("<QI")
+_FOOTER = struct.Struct("<QQQ8s")
+
+
+def write_archive(path: str, rows: Iterable[Dict], block_size: int = BLOCK_SIZE) -> int:
+    """
+    Write rows (each with an "id") to a compressed archive file, returning the count.
+    
+    Never overwrites: raises FileExistsError if `path` already exists. On any
+    failure only the temporary file created by this call is removed.
+    """
+    index = []
+    blocks = []
+    block: List[Dict] = []
+    tmp_path = path + ".tmp"
+    
+    f = open(tmp_path, "xb")
+    try:
+        with f:
+            f.write(MAGIC)
+            
+            def flush():
+                data = zlib.compress(json.dumps(block, default=str).encode(), 6)
+                blocks.append((f.tell(), len(data)))
+                f.write(data)
+                block.clear()
+            
+            for row in rows:
+                index.append((UUID(str(row["id"])).bytes, len(blocks)))
+                block.append(row)
+                if len(block) >= block_size:
+                    flush()
+            if block:
+                flush()
+            
+            index.sort()
+            index_offset = f.tell()
+            for entry in index:
+                f.write(_INDEX_ENTRY.pack(*entry))
+            for entry in blocks:
+                f.write(_BLOCK_ENTRY.pack(*entry))
+            f.write(_FOOTER.pack(index_offset, len(index), len(blocks), MAGIC))
+            
+            f.flush()
+            os.fsync(f.fileno())
+        
+        # Unlike os.replace, linking fails instead of replacing an existing archive
+        os.link(tmp_path, path)
+    finally:
+        os.remove(tmp_path)
+    
+    return len(index)
+
+
+class HandArchive:
+    """Read-only, memory-mapped view of one archive file."""
+    
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        
+        self._index_offset, self._count, self._block_count, magic = _FOOTER.unpack_from(
+            self._mmap, len(self._mmap) - _FOOTER.size
+        )
+        if magic != MAGIC or self._mmap[: len(MAGIC)] != MAGIC:
+            self._mmap.close()
+            raise ValueError(f"Not a hand archive: '{path}'")
+        
+        self._blocks_offset = self._index_offset + self._count * _INDEX_ENTRY.size
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    def _index_key(self, position: int) -> bytes:
+        start = self._index_offset + position * _INDEX_ENTRY.size
+        return self._mmap[start : start + 16]
+    
+    def find(self, hand_id: UUID) -> Optional[Dict]:
+        """Find an archived row by hand ID with a binary search of the id index."""
+        key = hand_id.bytes
+        keys = _IndexKeys(self)
+        position = bisect.bisect_left(keys, key)
+        if position == self._count or self._index_key(position) != key:
+            return None
+        
+        _, block_number = _INDEX_ENTRY.unpack_from(
+            self._mmap, self._index_offset + position * _INDEX_ENTRY.size
+        )
+        offset, length = _BLOCK_ENTRY.unpack_from(
+            self._mmap, self._blocks_offset + block_number * _BLOCK_ENTRY.size
+        )
+        rows = json.loads(zlib.decompress(self._mmap[offset : offset + length]))
+        
+        target = str(hand_id)
+        for row in rows:
+            if row["id"] == target:
+                return row
+        return None
+    
+    def close(self):
+        """Unmap the archive file."""
+        self._mmap.close()
+
+
+class _IndexKeys:
+    """Sequence view over the sorted UUID keys of an archive, for bisect."""
+    
+    def __init__(self, archive: HandArchive):
+        self._archive = archive
+    
+    def __len__(self) -> int:
+        return len(self._archive)
+    
+    def __getitem__(self, position: int) -> bytes:
+        return self._archive._index_key(position)
+
+
+class ArchiveStore:
+    """Looks up hands across every archive file in a directory."""
+    
+    def __init__(self, directory: str):
+        self.directory = directory
+        self._archives: Dict[str, HandArchive] = {}
+    
+    def _refresh(self) -> List[HandArchive]:
+        """Open any archive files written since the last lookup, newest first."""
+        if not os.path.isdir(self.directory):
+            return []
+        
+        for filename in os.listdir(self.directory):
+            if filename.endswith(ARCHIVE_SUFFIX) and filename not in self._archives:
+                self._archives[filename] = HandArchive(os.path.join(self.directory, filename))
+        
+        return [self._archives[name] for name in sorted(self._archives, reverse=True)]
+    
+    def find(self, hand_id: UUID) -> Optional[Dict]:
+        """Find an archived row by hand ID."""
+        for archive in self._refresh():
+            row = archive.find(hand_id)
+            if row is not None:
+                return row
+        return None
+    
+    def close(self):
+        """Unmap every open archive file."""
+        for archive in self._archives.values():
+            archive.close()
+        self._archives.clear()
+
+
+def _move_partition(conn: Connection, name: str, path: str) -> int:
+    """Export, verify, detach and drop one partition in a single transaction."""
+    cursor = conn.cursor()
+    # Fail fast instead of queueing every other query on hands behind our lock request
+    cursor.execute(f"SET LOCAL lock_timeout = '{LOCK_TIMEOUT}'")
+    # Held until commit, so the export, the count and the detach see the same rows
+    cursor.execute(f"LOCK TABLE {name} IN SHARE MODE")
+    
+    reader = conn.cursor(name=f"archive_{name}")
+    reader.itersize = 2000
+    reader.execute(f"SELECT * FROM {name} ORDER BY id")
+    
+    def rows():
+        columns = None
+        for row in reader:
+            columns = columns or [column[0] for column in reader.description]
+            yield dict(zip(columns, row))
+    
+    written = False
+    try:
+        count = write_archive(path, rows())
+        written = True
+        reader.close()
+        
+        cursor.execute(f"SELECT COUNT(*) FROM {name}")
+        expected = cursor.fetchone()[0]
+        if expected != count:
+            raise RuntimeError(f"Archived {count} rows from {name}, expected {expected}")
+        
+        cursor.execute(f"ALTER TABLE hands DETACH PARTITION {name}")
+        cursor.execute(f"DROP TABLE {name}")
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        if written:
+            os.remove(path)
+        raise
+    finally:
+        cursor.close()
+    
+    return count
+
+
+def archive_partition(
+    conn: Connection, name: str, directory: str, attempts: int = LOCK_ATTEMPTS
+) -> int:
+    """
+    Move one partition into an archive file.
+    
+    The partition is locked against writes for the whole move, and is only
+    detached and dropped once the file is written and its row count matches
+    the table. An existing archive of the same partition is never replaced;
+    the new file gets a timestamp suffix instead. Detaching needs an exclusive lock on hands; when it cannot be
+    had within LOCK_TIMEOUT the move is rolled back and retried.
+    """
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, name + ARCHIVE_SUFFIX)
+    if os.path.exists(path):
+        # The month was archived before and its partition recreated since
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S")
+        path = os.path.join(directory, f"{name}.{stamp}{ARCHIVE_SUFFIX}")
+    
+    for attempt in range(1, attempts + 1):
+        try:
+            return _move_partition(conn, name, path)
+        except LockNotAvailable:
+            if attempt == attempts:
+                raise
+            logger.info("%s: lock not available, retrying (%d/%d)", name, attempt, attempts)
+            time.sleep(LOCK_RETRY_DELAY * attempt)
+
+
+def archive_partitions(
+    conn: Connection, directory: str, keep_months: int = 6, now: Optional[datetime] = None
+) -> List[str]:
+    """Archive every partition that ends before the newest `keep_months` months."""
+    cutoff = add_months(current_month(now), -keep_months)
+    
+    cursor = conn.cursor()
+    names = [partition.name for partition in list_partitions(cursor) if partition.upper <= cutoff]
+    conn.commit()
+    cursor.close()
+    
+    for name in names:
+        count = archive_partition(conn, name, directory)
+        logger.info("archived %s: %d rows", name, count)
+    
+    return names
+
+
+def main(argv: Optional[List[str]] = None):
+    """Archive cold partitions from the command line."""
+    parser = argparse.ArgumentParser(description="Archive cold hand partitions.")
+    parser.add_argument("--keep-months", type=int, default=6)
+    parser.add_argument("--dir", default=os.getenv("ARCHIVE_DIR", "archive"))
+    args = parser.parse_args(argv)
+    
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    archive_partitions(get_db_connection(), args.dir, keep_months=args.keep_months)
+
+
+if __name__ == "__main__":
+    main()
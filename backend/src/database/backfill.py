@@ -0,0 +1,328 @@
+import argparse
+import json
+import logging
+import multiprocessing
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from psycopg2.extensions import connection as Connection
+from psycopg2.extras import execute_values
+
+from src.database.connection import create_db_connection, get_db_connection, init_db
+from src.domain.hand import Hand
+from src.domain.hand_metrics import derive_hand_metrics
+from src.repository.base import row_to_hand
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Backfill:
+    """A derived-column backfill over the hands table."""
+    
+    name: str
+    columns: Tuple[Tuple[str, str], ...]  # (column, SQL type) pairs
+    derive: Callable[[Hand], Dict[str, object]]
+    pending: str  # SQL predicate matching rows that still need values
+
+
+@dataclass
+class BackfillProgress:
+    """Running totals reported while a backfill is in progress."""
+    
+    name: str
+    rows: int = 0
+    chunks: int = 0
+    elapsed: float = 0.0
+    
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.elapsed if self.elapsed > 0 else 0.0
+
+
+BACKFILLS: Dict[str, Backfill] = {
+    "hand_metrics": Backfill(
+        name="hand_metrics",
+        columns=(
+            ("pot_size", "integer"),
+            ("street_reached", "text"),
+            ("winner_seats", "jsonb"),
+            ("action_opcodes", "text"),
+            ("went_to_showdown", "boolean"),
+        ),
+        derive=derive_hand_metrics,
+        pending="street_reached IS NULL",
+    ),
+}
+
+
+def _next_chunk_bound(
+    conn: Connection, backfill: Backfill, after: Optional[str], chunk_size: int
+) -> Optional[str]:
+    """Get the last id of the next keyset-ordered chunk of pending rows."""
+    cursor = conn.cursor()
+    
+    cursor.execute(
+        f"""
+        SELECT id FROM (
+            SELECT id FROM hands
+            WHERE ({backfill.pending}) AND (%s::uuid IS NULL OR id > %s::uuid)
+            ORDER BY id
+            LIMIT %s
+        ) AS chunk
+        ORDER BY id DESC
+        LIMIT 1
+        """,
+        (after, after, chunk_size),
+    )
+    
+    row = cursor.fetchone()
+    conn.commit()
+    cursor.close()
+    return None if row is None else str(row[0])
+
+
+def _iter_chunks(
+    conn: Connection, backfill: Backfill, after: Optional[str], chunk_size: int
+) -> Iterator[Tuple[Optional[str], str]]:
+    """Yield (exclusive lower, inclusive upper) id bounds for each chunk."""
+    while True:
+        upper = _next_chunk_bound(conn, backfill, after, chunk_size)
+        if upper is None:
+            return
+        yield after, upper
+        after = upper
+
+
+def backfill_chunk(
+    conn: Connection, backfill: Backfill, lower: Optional[str], upper: str
+) -> int:
+    """
+    Derive and write the columns for one chunk, returning the rows updated.
+    
+    Rows are matched on the full (id, created_at) key so each update only
+    touches the partition holding the row.
+    """
+    cursor = conn.cursor()
+    
+    cursor.execute(
+        f"""
+        SELECT id, stacks, dealer_position, small_blind_position,
+               big_blind_position, hole_cards, actions, board_cards, payoffs,
+               created_at
+        FROM hands
+        WHERE ({backfill.pending})
+          AND (%s::uuid IS NULL OR id > %s::uuid) AND id <= %s::uuid
+        ORDER BY id
+        """,
+        (lower, lower, upper),
+    )
+    
+    values = []
+    for row in cursor.fetchall():
+        hand = row_to_hand(row)
+        derived = backfill.derive(hand)
+        values.append(
+            (str(hand.id), row[9])
+            + tuple(
+                json.dumps(derived[column]) if sql_type == "jsonb" else derived[column]
+                for column, sql_type in backfill.columns
+            )
+        )
+    
+    if values:
+        names = [column for column, _ in backfill.columns]
+        assignments = ", ".join(f"{name} = v.{name}" for name in names)
+        template = "(%s::uuid, %s::timestamp, " + ", ".join(
+            f"%s::{sql_type}" for _, sql_type in backfill.columns
+        ) + ")"
+        execute_values(
+            cursor,
+            f"""
+            UPDATE hands AS h SET {assignments}
+            FROM (VALUES %s) AS v(id, created_at, {", ".join(names)})
+            WHERE h.id = v.id AND h.created_at = v.created_at
+            """,
+            values,
+            template=template,
+            page_size=len(values),
+        )
+    
+    conn.commit()
+    cursor.close()
+    return len(values)
+
+
+_worker_connection: Optional[Connection] = None
+
+
+def _init_worker():
+    """Give each worker process its own database connection."""
+    global _worker_connection
+    _worker_connection = create_db_connection()
+
+
+def _worker_backfill_chunk(name: str, lower: Optional[str], upper: str) -> int:
+    """Process one chunk inside a worker process."""
+    return backfill_chunk(_worker_connection, BACKFILLS[name], lower, upper)
+
+
+def _load_checkpoint(conn: Connection, name: str) -> Tuple[Optional[str], int]:
+    """Get the last completed id and row count of an interrupted backfill."""
+    cursor = conn.cursor()
+    cursor.execute(
+        "SELECT last_id, rows_done FROM backfill_checkpoints WHERE name = %s", (name,)
+    )
+    row = cursor.fetchone()
+    conn.commit()
+    cursor.close()
+    return (None, 0) if row is None else (str(row[0]), row[1])
+
+
+def _save_checkpoint(conn: Connection, name: str, last_id: str, rows_done: int):
+    """Record the last id below which every chunk has been written."""
+    cursor = conn.cursor()
+    cursor.execute(
+        """
+        INSERT INTO backfill_checkpoints (name, last_id, rows_done)
+        VALUES (%s, %s, %s)
+        ON CONFLICT (name) DO UPDATE
+        SET last_id = EXCLUDED.last_id,
+            rows_done = EXCLUDED.rows_done,
+            updated_at = CURRENT_TIMESTAMP
+        """,
+        (name, last_id, rows_done),
+    )
+    conn.commit()
+    cursor.close()
+
+
+def _clear_checkpoint(conn: Connection, name: str):
+    """Forget the checkpoint of a finished backfill."""
+    cursor = conn.cursor()
+    cursor.execute("DELETE FROM backfill_checkpoints WHERE name = %s", (name,))
+    conn.commit()
+    cursor.close()
+
+
+def _run_chunks(
+    conn: Connection,
+    backfill: Backfill,
+    after: Optional[str],
+    chunk_size: int,
+    workers: int,
+) -> Iterator[Tuple[str, int]]:
+    """Process chunks and yield (upper id, rows updated) in keyset order."""
+    chunks = _iter_chunks(conn, backfill, after, chunk_size)
+    
+    if workers <= 1:
+        for lower, upper in chunks:
+            yield upper, backfill_chunk(conn, backfill, lower, upper)
+        return
+    
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(workers, initializer=_init_worker) as pool:
+        in_flight: deque = deque()
+        for lower, upper in chunks:
+            in_flight.append(
+                (upper, pool.apply_async(_worker_backfill_chunk, (backfill.name, lower, upper)))
+            )
+            # Bound the queue so throttling and checkpoints track real progress
+            if len(in_flight) >= workers * 2:
+                upper, result = in_flight.popleft()
+                yield upper, result.get()
+        
+        while in_flight:
+            upper, result = in_flight.popleft()
+            yield upper, result.get()
+
+
+def run_backfill(
+    name: str,
+    workers: int = 4,
+    chunk_size: int = 1000,
+    max_rows_per_second: Optional[float] = None,
+    restart: bool = False,
+    on_progress: Optional[Callable[[BackfillProgress], None]] = None,
+) -> BackfillProgress:
+    """
+    Backfill derived columns across the hands table.
+    
+    Rows are processed in id-ordered chunks, spread over `workers` processes
+    (inline when `workers` <= 1). Chunks complete in order, so the checkpoint
+    always marks a point below which every row is written and an interrupted
+    run resumes from there. A resumed run finishes with a sweep from the
+    start, which picks up pending rows inserted below the checkpoint while it
+    was interrupted. `max_rows_per_second` throttles chunk submission.
+    """
+    if name not in BACKFILLS:
+        raise ValueError(f"Unknown backfill: '{name}'")
+    if chunk_size <= 0:
+        raise ValueError(f"Chunk size must be positive, got {chunk_size}")
+    
+    backfill = BACKFILLS[name]
+    conn = get_db_connection()
+    
+    after, rows_done = (None, 0) if restart else _load_checkpoint(conn, name)
+    if after is not None:
+        logger.info("%s: resuming after %s (%d rows already done)", name, after, rows_done)
+    
+    progress = BackfillProgress(name=name)
+    start = time.monotonic()
+    
+    passes = [after] if after is None else [after, None]
+    for pass_after in passes:
+        for upper, rows in _run_chunks(conn, backfill, pass_after, chunk_size, workers):
+            progress.rows += rows
+            progress.chunks += 1
+            progress.elapsed = time.monotonic() - start
+            _save_checkpoint(conn, name, upper, rows_done + progress.rows)
+            
+            logger.info(
+                "%s: %d rows in %d chunks (%.0f rows/sec)",
+                name, progress.rows, progress.chunks, progress.rows_per_second,
+            )
+            if on_progress is not None:
+                on_progress(progress)
+            
+            if max_rows_per_second:
+                delay = progress.rows / max_rows_per_second - progress.elapsed
+                if delay > 0:
+                    time.sleep(delay)
+    
+    progress.elapsed = time.monotonic() - start
+    _clear_checkpoint(conn, name)
+    return progress
+
+
+def main(argv: Optional[List[str]] = None):
+    """Run a backfill from the command line."""
+    parser = argparse.ArgumentParser(description="Backfill derived hand columns.")
+    parser.add_argument("name", choices=sorted(BACKFILLS))
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--max-rows-per-second", type=float, default=None)
+    parser.add_argument("--restart", action="store_true", help="ignore any saved checkpoint")
+    args = parser.parse_args(argv)
+    
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    init_db()
+    
+    progress = run_backfill(
+        args.name,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        max_rows_per_second=args.max_rows_per_second,
+        restart=args.restart,
+    )
+    logger.info(
+        "%s: done, %d rows in %.1fs (%.0f rows/sec)",
+        progress.name, progress.rows, progress.elapsed, progress.rows_per_second,
+    )
+
+
+if __name__ == "__main__":
+    main()
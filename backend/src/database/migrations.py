@@ -0,0 +1,168 @@
+from dataclasses import dataclass
+from typing import Callable, List, Optional
+
+from psycopg2.extensions import connection as Connection, cursor as Cursor
+
+from src.database.partitions import add_months, month_start
+
+
+@dataclass(frozen=True)
+class Migration:
+    """A versioned schema change applied on top of the base hands table."""
+    
+    version: int
+    name: str
+    sql: str = ""
+    apply: Optional[Callable[[Cursor], None]] = None
+
+
+def _partition_hands(cursor: Cursor):
+    """
+    Convert a plain hands table into one range-partitioned by month.
+    
+    The existing table is not copied: it is attached whole as a single
+    partition spanning the months it holds. That costs one read-only scan to
+    validate its range CHECK and one build of the (id, created_at) primary
+    key, both under this migration's lock.
+    """
+    cursor.execute("SELECT relkind FROM pg_class WHERE oid = 'hands'::regclass")
+    
+    if cursor.fetchone()[0] != "p":
+        cursor.execute("ALTER TABLE hands RENAME TO hands_legacy")
+        cursor.execute("ALTER INDEX hands_pkey RENAME TO hands_legacy_pkey")
+        cursor.execute(
+            "ALTER INDEX IF EXISTS idx_hands_created_at RENAME TO idx_hands_legacy_created_at"
+        )
+        cursor.execute(
+            "UPDATE hands_legacy SET created_at = CURRENT_TIMESTAMP WHERE created_at IS NULL"
+        )
+        cursor.execute("""
+            CREATE TABLE hands (LIKE hands_legacy INCLUDING DEFAULTS)
+            PARTITION BY RANGE (created_at)
+        """)
+        cursor.execute("ALTER TABLE hands ALTER COLUMN created_at SET NOT NULL")
+        cursor.execute("ALTER TABLE hands ADD PRIMARY KEY (id, created_at)")
+        cursor.execute("CREATE INDEX idx_hands_created_at ON hands(created_at DESC)")
+        
+        cursor.execute("SELECT MIN(created_at), MAX(created_at) FROM hands_legacy")
+        oldest, newest = cursor.fetchone()
+        
+        if oldest is None:
+            cursor.execute("DROP TABLE hands_legacy")
+        else:
+            lower = month_start(oldest)
+            upper = add_months(month_start(newest), 1)
+            
+            # A valid CHECK matching the bound lets SET NOT NULL and ATTACH skip their scans
+            cursor.execute(
+                """
+                ALTER TABLE hands_legacy ADD CONSTRAINT hands_legacy_range CHECK (
+                    created_at IS NOT NULL AND created_at >= %s AND created_at < %s
+                )
+                """,
+                (lower, upper),
+            )
+            cursor.execute("ALTER TABLE hands_legacy ALTER COLUMN created_at SET NOT NULL")
+            cursor.execute("ALTER TABLE hands_legacy DROP CONSTRAINT hands_legacy_pkey")
+            cursor.execute("ALTER TABLE hands_legacy ADD PRIMARY KEY (id, created_at)")
+            cursor.execute(
+                "ALTER TABLE hands ATTACH PARTITION hands_legacy FOR VALUES FROM (%s) TO (%s)",
+                (lower, upper),
+            )
+    
+    cursor.execute("CREATE TABLE IF NOT EXISTS hands_default PARTITION OF hands DEFAULT")
+
+
+MIGRATIONS: List[Migration] = [
+    Migration(
+        version=1,
+        name="backfill_checkpoints",
+        sql="""
+            CREATE TABLE IF NOT EXISTS backfill_checkpoints (
+                name TEXT PRIMARY KEY,
+                last_id UUID NOT NULL,
+                rows_done BIGINT NOT NULL,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """,
+    ),
+    Migration(
+        version=2,
+        name="hand_derived_columns",
+        sql="""
+            ALTER TABLE hands
+                ADD COLUMN IF NOT EXISTS pot_size INTEGER,
+                ADD COLUMN IF NOT EXISTS street_reached TEXT,
+                ADD COLUMN IF NOT EXISTS winner_seats JSONB,
+                ADD COLUMN IF NOT EXISTS action_opcodes TEXT,
+                ADD COLUMN IF NOT EXISTS went_to_showdown BOOLEAN
+        """,
+    ),
+    Migration(
+        version=3,
+        name="monthly_hand_partitions",
+        apply=_partition_hands,
+    ),
+    Migration(
+        version=4,
+        name="hand_metrics_pending_index",
+        sql="""
+            CREATE INDEX IF NOT EXISTS idx_hands_metrics_pending
+            ON hands(id) WHERE street_reached IS NULL
+        """,
+    ),
+]
+
+
+def get_schema_version(conn: Connection) -> int:
+    """Get the highest applied migration version."""
+    cursor = conn.cursor()
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS schema_migrations (
+            version INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    cursor.execute("SELECT COALESCE(MAX(version), 0) FROM schema_migrations")
+    version = cursor.fetchone()[0]
+    conn.commit()
+    cursor.close()
+    return version
+
+
+def run_migrations(conn: Connection) -> List[Migration]:
+    """Apply every pending migration, each in its own transaction."""
+    current = get_schema_version(conn)
+    applied = []
+    
+    for migration in sorted(MIGRATIONS, key=lambda m: m.version):
+        if migration.version <= current:
+            continue
+        
+        cursor = conn.cursor()
+        try:
+            if migration.sql:
+                cursor.execute(migration.sql)
+            if migration.apply is not None:
+                migration.apply(cursor)
+            cursor.execute(
+                "INSERT INTO schema_migrations (version, name) VALUES (%s, %s)",
+                (migration.version, migration.name),
+            )
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            cursor.close()
+        
+        applied.append(migration)
+    
+    return applied
+
+
+if __name__ == "__main__":
+    from src.database.connection import init_db
+    
+    init_db()
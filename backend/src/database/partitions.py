@@ -0,0 +1,99 @@
+import re
+from datetime import MAXYEAR, MINYEAR, datetime, timezone
+from typing import List, NamedTuple, Optional, Tuple
+
+from psycopg2.extensions import cursor as Cursor
+
+
+PARTITION_BOUND = re.compile(r"^FOR VALUES FROM \('([^']+)'\) TO \('([^']+)'\)$")
+
+
+def month_start(value: datetime) -> datetime:
+    """Get the first instant of the month containing `value`."""
+    return value.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def add_months(month: datetime, months: int) -> datetime:
+    """Shift a month start by a number of months, clamped to the datetime range."""
+    index = month.year * 12 + month.month - 1 + months
+    if index // 12 > MAXYEAR:
+        return datetime.max
+    if index // 12 < MINYEAR:
+        return datetime.min
+    return month.replace(year=index // 12, month=index % 12 + 1)
+
+
+def partition_name(month: datetime) -> str:
+    """Get the name of the partition holding a month."""
+    return f"hands_{month:%Y_%m}"
+
+
+def current_month(now: Optional[datetime] = None) -> datetime:
+    """Get the start of the current UTC month (or of `now`'s month)."""
+    return month_start(now or datetime.now(timezone.utc).replace(tzinfo=None))
+
+
+class Partition(NamedTuple):
+    """An attached range partition of the hands table."""
+    
+    name: str
+    lower: datetime
+    upper: datetime
+
+
+def parse_partition_bound(bound: str) -> Optional[Tuple[datetime, datetime]]:
+    """Parse a "FOR VALUES FROM (...) TO (...)" bound; None for DEFAULT or open bounds."""
+    match = PARTITION_BOUND.match(bound)
+    if match is None:
+        return None
+    return datetime.fromisoformat(match.group(1)), datetime.fromisoformat(match.group(2))
+
+
+def list_partitions(cursor: Cursor) -> List[Partition]:
+    """Get the attached range partitions, oldest first."""
+    cursor.execute("""
+        SELECT c.relname, pg_get_expr(c.relpartbound, c.oid)
+        FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = 'hands'::regclass
+    """)
+    
+    partitions = []
+    for name, bound in cursor.fetchall():
+        bounds = parse_partition_bound(bound or "")
+        if bounds is not None:
+            partitions.append(Partition(name, *bounds))
+    
+    return sorted(partitions, key=lambda partition: partition.lower)
+
+
+def ensure_partition(cursor: Cursor, month: datetime) -> str:
+    """
+    Create the monthly partition for `month` if no partition covers it yet.
+    
+    Returns the name of the partition holding the month, which may be a
+    wider one such as the attached legacy table.
+    """
+    month = month_start(month)
+    upper = add_months(month, 1)
+    for partition in list_partitions(cursor):
+        if partition.lower < upper and month < partition.upper:
+            return partition.name
+    
+    name = partition_name(month)
+    cursor.execute(
+        f"""
+        CREATE TABLE IF NOT EXISTS {name}
+        PARTITION OF hands FOR VALUES FROM (%s) TO (%s)
+        """,
+        (month, upper),
+    )
+    return name
+
+
+def ensure_partitions(
+    cursor: Cursor, months_ahead: int = 3, now: Optional[datetime] = None
+) -> List[str]:
+    """Create partitions for the current month and the next `months_ahead`."""
+    current = current_month(now)
+    return [ensure_partition(cursor, add_months(current, i)) for i in range(months_ahead + 1)]
@@ -1,12 +1,41 @@
+import os
+import time
 from dataclasses import dataclass, field
-from typing import List, Dict
-from uuid import UUID, uuid4
+from datetime import datetime, timezone
+from typing import List, Dict, Optional
+from uuid import UUID
+
+
+def new_hand_id() -> UUID:
+    """Generate a time-ordered (version 7) UUID for a new hand."""
+    millis = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+    value = (
+        (millis & 0xFFFF_FFFF_FFFF) << 80
+        | 0x7 << 76
+        | (rand >> 62 & 0xFFF) << 64
+        | 0b10 << 62
+        | rand & 0x3FFF_FFFF_FFFF_FFFF
+    )
+    return UUID(int=value)
+
+
+def hand_id_timestamp(hand_id: UUID) -> Optional[datetime]:
+    """Get the UTC creation time encoded in a version 7 hand ID."""
+    if hand_id.version != 7:
+        return None
+    millis = hand_id.int >> 80
+    try:
+        return datetime.fromtimestamp(millis / 1000, tz=timezone.utc).replace(tzinfo=None)
+    except (ValueError, OverflowError):
+        # Well-formed but past what datetime can represent (year 9999)
+        return None
 
 @dataclass
 class Hand:
     """Represents a completed poker hand."""
     
-    id: UUID = field(default_factory=uuid4)
+    id: UUID = field(default_factory=new_hand_id)
     stacks: List[int] = field(default_factory=list)
     dealer_position: int = 0
     small_blind_position: int = 0
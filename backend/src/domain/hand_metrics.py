@@ -0,0 +1,150 @@
+from typing import Dict, List, Tuple
+
+from src.domain.hand import Hand
+
+
+SMALL_BLIND = 20
+BIG_BLIND = 40
+
+STREETS = ("preflop", "flop", "turn", "river")
+
+# One opcode per player action; "/" separates streets
+OPCODES = {"f": "f", "x": "x", "c": "c", "b": "b", "r": "r", "allin": "a"}
+
+
+def _tokens(actions: str) -> List[str]:
+    """Split an action string into its comma-separated tokens."""
+    return [part.strip() for part in actions.split(",") if part.strip()]
+
+
+def _is_board_token(token: str) -> bool:
+    """Check whether a token deals board cards (e.g. 'flop:2c3d4h')."""
+    return ":" in token
+
+
+def street_reached(hand: Hand) -> str:
+    """Get the last street dealt in the hand."""
+    street = STREETS[0]
+    for token in _tokens(hand.actions):
+        if _is_board_token(token):
+            street = token.split(":", 1)[0].lower()
+    return street
+
+
+def winner_seats(hand: Hand) -> List[int]:
+    """Get the seats that finished the hand with a positive payoff."""
+    return [seat for seat, payoff in enumerate(hand.payoffs) if payoff > 0]
+
+
+def action_opcodes(hand: Hand) -> str:
+    """Normalize the action string into amount-free opcodes, e.g. 'ffcx/xbc'."""
+    opcodes = []
+    for token in _tokens(hand.actions):
+        if _is_board_token(token):
+            opcodes.append("/")
+        elif token in OPCODES:
+            opcodes.append(OPCODES[token])
+        else:
+            opcodes.append(OPCODES[token[0]])
+    return "".join(opcodes)
+
+
+def _replay_chips(hand: Hand) -> Tuple[List[int], List[int], List[bool], bool]:
+    """
+    Replay the chip movements of the hand.
+    
+    Follows the calculator's seating: seat 0 posts the small blind, seat 1 the
+    big blind and seat 2 opens preflop; seat 0 opens every later street.
+    Returns each seat's contributed chips, remaining stack and folded flag,
+    and whether the betting on the last street dealt is closed.
+    """
+    count = len(hand.stacks)
+    remaining = list(hand.stacks)
+    contributed = [0] * count
+    bets = [0] * count
+    folded = [False] * count
+    acted = [False] * count
+    
+    def put(seat: int, amount: int) -> None:
+        amount = max(0, min(amount, remaining[seat]))
+        if bets[seat] + amount > max(bets):
+            # A bet or raise reopens the action for everyone else
+            acted[:] = [False] * count
+        remaining[seat] -= amount
+        contributed[seat] += amount
+        bets[seat] += amount
+    
+    put(0, SMALL_BLIND)
+    put(1 % count, BIG_BLIND)
+    acted = [False] * count
+    actor = 2 % count
+    
+    for token in _tokens(hand.actions):
+        if _is_board_token(token):
+            bets[:] = [0] * count
+            acted[:] = [False] * count
+            actor = 0
+            continue
+        
+        # Folded and all-in players are skipped
+        for _ in range(count):
+            if not folded[actor] and remaining[actor] > 0:
+                break
+            actor = (actor + 1) % count
+        
+        if token == "f":
+            folded[actor] = True
+        elif token in ("x", "c"):
+            put(actor, max(bets) - bets[actor])
+        elif token == "allin":
+            put(actor, remaining[actor])
+        else:
+            put(actor, int(token[1:]) - bets[actor])
+        
+        acted[actor] = True
+        actor = (actor + 1) % count
+    
+    # Players who can still bet must have matched the top bet, and have acted
+    # since it unless they are the only one left able to bet
+    able = [seat for seat in range(count) if not folded[seat] and remaining[seat] > 0]
+    matched = all(bets[seat] >= max(bets) for seat in able)
+    closed = matched and (len(able) <= 1 or all(acted[seat] for seat in able))
+    
+    return contributed, remaining, folded, closed
+
+
+def pot_size(hand: Hand) -> int:
+    """Get the final pot; uncalled chips returned to the last aggressor are not counted."""
+    contributed, _, _, _ = _replay_chips(hand)
+    largest, second = sorted(contributed, reverse=True)[:2]
+    return sum(contributed) - (largest - second)
+
+
+def went_to_showdown(hand: Hand) -> bool:
+    """
+    Check whether the hand reached a showdown.
+    
+    More than one player must still be in, the betting on the last street
+    dealt must be closed, and either that street is the river or at most one
+    player has chips left to bet. Hands stored before their action finished
+    do not count.
+    """
+    _, remaining, folded, closed = _replay_chips(hand)
+    in_hand = [seat for seat, has_folded in enumerate(folded) if not has_folded]
+    if len(in_hand) < 2 or not closed:
+        return False
+    
+    if street_reached(hand) == "river":
+        return True
+    return sum(1 for seat in in_hand if remaining[seat] > 0) <= 1
+
+
+def derive_hand_metrics(hand: Hand) -> Dict[str, object]:
+    """Compute every derived column for a hand."""
+    return {
+        "pot_size": pot_size(hand),
+        "street_reached": street_reached(hand),
+        "winner_seats": winner_seats(hand),
+        "action_opcodes": action_opcodes(hand),
+        "went_to_showdown": went_to_showdown(hand),
+    }
@@ -0,0 +1,20 @@
+import os
+
+from src.repository.base import BaseHandRepository
+
+
+def get_hand_repository() -> BaseHandRepository:
+    """Create the hand repository selected by the REPOSITORY_BACKEND setting."""
+    backend = os.getenv("REPOSITORY_BACKEND", "postgres").lower()
+    
+    if backend == "postgres":
+        from src.repository.hand_repository import HandRepository
+        
+        return HandRepository()
+    
+    if backend == "sqlite":
+        from src.repository.sqlite_hand_repository import SqliteHandRepository
+        
+        return SqliteHandRepository(os.getenv("SQLITE_PATH", "poker.db"))
+    
+    raise ValueError(f"Unknown repository backend: '{backend}'")
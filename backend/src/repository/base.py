@@ -0,0 +1,61 @@
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Iterable, List, Optional
+from uuid import UUID
+
+from src.domain.hand import Hand
+
+
+def hand_params(hand: Hand) -> tuple:
+    """Convert a hand into the INSERT parameter tuple shared by every backend."""
+    return (
+        str(hand.id),
+        json.dumps(hand.stacks),
+        hand.dealer_position,
+        hand.small_blind_position,
+        hand.big_blind_position,
+        json.dumps(hand.hole_cards),
+        hand.actions,
+        hand.board_cards,
+        json.dumps(hand.payoffs),
+    )
+
+
+def _json_value(value: Any) -> Any:
+    """Decode a JSON column, which some backends return as text."""
+    return json.loads(value) if isinstance(value, str) else value
+
+
+def row_to_hand(row: tuple) -> Hand:
+    """Convert a SELECT row into a hand."""
+    return Hand(
+        id=UUID(str(row[0])),
+        stacks=_json_value(row[1]),
+        dealer_position=row[2],
+        small_blind_position=row[3],
+        big_blind_position=row[4],
+        hole_cards=_json_value(row[5]),
+        actions=row[6],
+        board_cards=row[7] or "",
+        payoffs=_json_value(row[8]),
+    )
+
+
+class BaseHandRepository(ABC):
+    """Interface every hand storage backend implements."""
+
+    @abstractmethod
+    def save(self, hand: Hand) -> Hand:
+        """Save a hand."""
+
+    @abstractmethod
+    def save_many(self, hands: Iterable[Hand]) -> List[Hand]:
+        """Save several hands in a single batch."""
+
+    @abstractmethod
+    def find_by_id(self, hand_id: UUID) -> Optional[Hand]:
+        """Find a hand by ID."""
+
+    @abstractmethod
+    def find_all(self, limit: int = 100) -> List[Hand]:
+        """Find all hands, ordered by creation date descending."""
@@ -1,16 +1,67 @@
 import json
-from typing import List, Optional
+import os
+from datetime import datetime, timezone
+from typing import Iterable, List, Optional, Set
 from uuid import UUID
 
+from psycopg2.extras import execute_values
+
+from src.database.archive import ArchiveStore
 from src.database.connection import get_db_connection
-from src.domain.hand import Hand
+from src.database.partitions import add_months, ensure_partition, month_start
+from src.domain.hand import Hand, hand_id_timestamp
+from src.domain.hand_metrics import derive_hand_metrics
+from src.repository.base import BaseHandRepository, hand_params, row_to_hand
+
+
+def _created_at(hand: Hand) -> datetime:
+    """Get the creation time of a hand, taken from its ID when time-ordered."""
+    return hand_id_timestamp(hand.id) or datetime.now(timezone.utc).replace(tzinfo=None)
 
 
-class HandRepository:
-    """Repository for managing hand persistence."""
+def _hand_params(hand: Hand, created_at: datetime) -> tuple:
+    """Convert a hand into the INSERT parameter tuple, derived columns included."""
+    metrics = derive_hand_metrics(hand)
+    return hand_params(hand) + (
+        metrics["pot_size"],
+        metrics["street_reached"],
+        json.dumps(metrics["winner_seats"]),
+        metrics["action_opcodes"],
+        metrics["went_to_showdown"],
+        created_at,
+    )
+
+
+class HandRepository(BaseHandRepository):
+    """Repository for managing hand persistence in PostgreSQL.
+    
+    Hands live in monthly partitions of the hands table; partitions that have
+    been archived are still found by ID through the archive files.
+    """
+    
+    def __init__(self, archive_dir: Optional[str] = None):
+        self.archive = ArchiveStore(archive_dir or os.getenv("ARCHIVE_DIR", "archive"))
+        self._partitions: Set[datetime] = set()
+    
+    def _ensure_partitions(self, created_at: Iterable[datetime]):
+        """Create the monthly partitions for these timestamps if needed."""
+        months = {month_start(value) for value in created_at} - self._partitions
+        if not months:
+            return
+        
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        for month in sorted(months):
+            ensure_partition(cursor, month)
+        conn.commit()
+        cursor.close()
+        self._partitions |= months
     
     def save(self, hand: Hand) -> Hand:
         """Save a hand to the database."""
+        created_at = _created_at(hand)
+        self._ensure_partitions([created_at])
+        
         conn = get_db_connection()
         cursor = conn.cursor()
         
@@ -18,62 +69,100 @@ class HandRepository:
             """
             INSERT INTO hands (
                 id, stacks, dealer_position, small_blind_position,
-                big_blind_position, hole_cards, actions, board_cards, payoffs
-            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+                big_blind_position, hole_cards, actions, board_cards, payoffs,
+                pot_size, street_reached, winner_seats, action_opcodes, went_to_showdown,
+                created_at
+            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
             RETURNING id
             """,
-            (
-                str(hand.id),
-                json.dumps(hand.stacks),
-                hand.dealer_position,
-                hand.small_blind_position,
-                hand.big_blind_position,
-                json.dumps(hand.hole_cards),
-                hand.actions,
-                hand.board_cards,
-                json.dumps(hand.payoffs),
-            ),
+            _hand_params(hand, created_at),
         )
         
         conn.commit()
         cursor.close()
         return hand
     
-    def find_by_id(self, hand_id: UUID) -> Optional[Hand]:
-        """Find a hand by ID."""
+    def save_many(self, hands: Iterable[Hand]) -> List[Hand]:
+        """Save several hands with a single multi-row INSERT."""
+        hands = list(hands)
+        if not hands:
+            return hands
+        
+        params = [_hand_params(hand, _created_at(hand)) for hand in hands]
+        self._ensure_partitions(param[-1] for param in params)
+        
         conn = get_db_connection()
         cursor = conn.cursor()
         
-        cursor.execute(
+        execute_values(
+            cursor,
             """
-            SELECT id, stacks, dealer_position, small_blind_position,
-                   big_blind_position, hole_cards, actions, board_cards, payoffs
-            FROM hands
-            WHERE id = %s
+            INSERT INTO hands (
+                id, stacks, dealer_position, small_blind_position,
+                big_blind_position, hole_cards, actions, board_cards, payoffs,
+                pot_size, street_reached, winner_seats, action_opcodes, went_to_showdown,
+                created_at
+            ) VALUES %s
             """,
-            (str(hand_id),),
+            params,
         )
         
+        conn.commit()
+        cursor.close()
+        return hands
+    
+    def find_by_id(self, hand_id: UUID) -> Optional[Hand]:
+        """Find a hand by ID, falling back to the archive.
+        
+        Time-ordered IDs carry their creation month, which limits the lookup
+        to a single partition.
+        """
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        
+        created_at = hand_id_timestamp(hand_id)
+        if created_at is None:
+            cursor.execute(
+                """
+                SELECT id, stacks, dealer_position, small_blind_position,
+                       big_blind_position, hole_cards, actions, board_cards, payoffs
+                FROM hands
+                WHERE id = %s
+                """,
+                (str(hand_id),),
+            )
+        else:
+            month = month_start(created_at)
+            cursor.execute(
+                """
+                SELECT id, stacks, dealer_position, small_blind_position,
+                       big_blind_position, hole_cards, actions, board_cards, payoffs
+                FROM hands
+                WHERE id = %s AND created_at >= %s AND created_at < %s
+                """,
+                (str(hand_id), month, add_months(month, 1)),
+            )
+        
         row = cursor.fetchone()
+        # End the read transaction so no lock on hands outlives the query
+        conn.commit()
         cursor.close()
         
-        if row is None:
+        if row is not None:
+            return row_to_hand(row)
+        
+        archived = self.archive.find(hand_id)
+        if archived is None:
             return None
         
-        return Hand(
-            id=UUID(row[0]),
-            stacks=row[1],
-            dealer_position=row[2],
-            small_blind_position=row[3],
-            big_blind_position=row[4],
-            hole_cards=row[5],
-            actions=row[6],
-            board_cards=row[7] or "",
-            payoffs=row[8],
-        )
+        return Hand.from_dict({**archived, "board_cards": archived.get("board_cards") or ""})
     
     def find_all(self, limit: int = 100) -> List[Hand]:
-        """Find all hands, ordered by creation date descending."""
+        """Find all hands, ordered by creation date descending.
+        
+        The partitions are scanned newest first through their created_at
+        indexes, so older partitions are only read when the limit needs them.
+        """
         conn = get_db_connection()
         cursor = conn.cursor()
         
@@ -89,22 +178,7 @@ class HandRepository:
         )
         
         rows = cursor.fetchall()
+        conn.commit()
         cursor.close()
         
-        hands = []
-        for row in rows:
-            hands.append(
-                Hand(
-                    id=UUID(row[0]),
-                    stacks=row[1],
-                    dealer_position=row[2],
-                    small_blind_position=row[3],
-                    big_blind_position=row[4],
-                    hole_cards=row[5],
-                    actions=row[6],
-                    board_cards=row[7] or "",
-                    payoffs=row[8],
-                )
-            )
-        
-        return hands
\ No newline at end of file
+        return [row_to_hand(row) for row in rows]
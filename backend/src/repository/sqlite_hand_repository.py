@@ -0,0 +1,147 @@
+import sqlite3
+import threading
+from typing import Iterable, List, Optional
+from uuid import UUID
+
+from src.domain.hand import Hand
+from src.repository.base import BaseHandRepository, hand_params, row_to_hand
+
+
+# 256 MiB of the database file is mapped into memory for reads
+MMAP_SIZE = 256 * 1024 * 1024
+
+
+class SqliteHandRepository(BaseHandRepository):
+    """Repository for managing hand persistence in an embedded SQLite file.
+    
+    The database runs in WAL mode so readers never block the writer. Writes
+    go through a single connection behind a lock; every thread reads through
+    its own connection over a memory-mapped view of the file.
+    """
+    
+    def __init__(self, path: str = "poker.db"):
+        self.path = path
+        self._writer: Optional[sqlite3.Connection] = None
+        self._write_lock = threading.Lock()
+        self._local = threading.local()
+        self._readers: List[sqlite3.Connection] = []
+        self._readers_lock = threading.Lock()
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection with the WAL and memory-mapping settings."""
+        conn = sqlite3.connect(self.path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"PRAGMA mmap_size={MMAP_SIZE}")
+        return conn
+    
+    def _get_writer(self) -> sqlite3.Connection:
+        """Get the write connection, creating the schema on first use."""
+        if self._writer is None:
+            conn = self._connect()
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS hands (
+                    id TEXT PRIMARY KEY,
+                    stacks TEXT NOT NULL,
+                    dealer_position INTEGER NOT NULL,
+                    small_blind_position INTEGER NOT NULL,
+                    big_blind_position INTEGER NOT NULL,
+                    hole_cards TEXT NOT NULL,
+                    actions TEXT NOT NULL,
+                    board_cards TEXT,
+                    payoffs TEXT NOT NULL,
+                    created_at TEXT DEFAULT (strftime('%Y-%m-%d %H:%M:%f', 'now'))
+                )
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_hands_created_at ON hands(created_at DESC)
+            """)
+            conn.commit()
+            self._writer = conn
+        
+        return self._writer
+    
+    def _get_reader(self) -> sqlite3.Connection:
+        """Get the read connection of the calling thread."""
+        conn = getattr(self._local, "connection", None)
+        if conn is None:
+            # The schema must exist before a reader can query it
+            if self._writer is None:
+                with self._write_lock:
+                    self._get_writer()
+            conn = self._connect()
+            self._local.connection = conn
+            with self._readers_lock:
+                self._readers.append(conn)
+        
+        return conn
+    
+    def close(self):
+        """Close every SQLite connection."""
+        with self._write_lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+        with self._readers_lock:
+            for conn in self._readers:
+                conn.close()
+            self._readers.clear()
+        self._local = threading.local()
+    
+    def save(self, hand: Hand) -> Hand:
+        """Save a hand to the database."""
+        self.save_many([hand])
+        return hand
+    
+    def save_many(self, hands: Iterable[Hand]) -> List[Hand]:
+        """Save several hands in a single transaction."""
+        hands = list(hands)
+        if not hands:
+            return hands
+        
+        with self._write_lock:
+            conn = self._get_writer()
+            with conn:
+                conn.executemany(
+                    """
+                    INSERT INTO hands (
+                        id, stacks, dealer_position, small_blind_position,
+                        big_blind_position, hole_cards, actions, board_cards, payoffs
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    [hand_params(hand) for hand in hands],
+                )
+        
+        return hands
+    
+    def find_by_id(self, hand_id: UUID) -> Optional[Hand]:
+        """Find a hand by ID."""
+        row = self._get_reader().execute(
+            """
+            SELECT id, stacks, dealer_position, small_blind_position,
+                   big_blind_position, hole_cards, actions, board_cards, payoffs
+            FROM hands
+            WHERE id = ?
+            """,
+            (str(hand_id),),
+        ).fetchone()
+        
+        if row is None:
+            return None
+        
+        return row_to_hand(row)
+    
+    def find_all(self, limit: int = 100) -> List[Hand]:
+        """Find all hands, ordered by creation date descending."""
+        rows = self._get_reader().execute(
+            """
+            SELECT id, stacks, dealer_position, small_blind_position,
+                   big_blind_position, hole_cards, actions, board_cards, payoffs
+            FROM hands
+            ORDER BY created_at DESC, rowid DESC
+            LIMIT ?
+            """,
+            (limit,),
+        ).fetchall()
+        
+        return [row_to_hand(row) for row in rows]
@@ -128,4 +128,16 @@ def test_create_hand_empty_actions(mock_repository):
     }
     
     response = client.post("/api/hands", json=hand_data)
-    assert response.status_code == 422
\ No newline at end of file
+    assert response.status_code == 422
+
+
+def test_get_hand_far_future_id():
+    """Test a valid version 7 ID past year 9999 is looked up, not a server error."""
+    from src.repository.hand_repository import HandRepository
+    
+    with patch('src.repository.hand_repository.get_db_connection') as mock_connection:
+        mock_connection.return_value.cursor.return_value.fetchone.return_value = None
+        with patch('src.api.hands.repository', HandRepository(archive_dir="missing")):
+            response = client.get("/api/hands/ffffffff-ffff-7fff-bfff-ffffffffffff")
+    
+    assert response.status_code == 404
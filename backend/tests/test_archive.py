@@ -0,0 +1,123 @@
+from datetime import datetime
+
+import pytest
+from uuid import uuid4
+
+from src.database.archive import ArchiveStore, HandArchive, write_archive
+from src.domain.hand import Hand
+from tests.conftest import make_hand
+
+
+def make_row(**overrides) -> dict:
+    """Build an archived hands row."""
+    row = {**make_hand().to_dict(), "created_at": datetime(2024, 1, 15, 12, 30)}
+    row.update(overrides)
+    return row
+
+
+def test_write_and_find(tmp_path):
+    """Test every archived row can be found by ID across several blocks."""
+    rows = [make_row() for _ in range(50)]
+    path = str(tmp_path / "hands_2024_01.arc")
+    
+    assert write_archive(path, iter(rows), block_size=8) == 50
+    
+    archive = HandArchive(path)
+    assert len(archive) == 50
+    for row in rows:
+        found = archive.find(Hand.from_dict(row).id)
+        assert found["id"] == row["id"]
+        assert found["payoffs"] == row["payoffs"]
+        assert found["created_at"] == "2024-01-15 12:30:00"
+    assert archive.find(uuid4()) is None
+    archive.close()
+
+
+def test_never_overwrites(tmp_path):
+    """Test an existing archive is neither replaced nor removed by a failed write."""
+    row = make_row()
+    path = str(tmp_path / "hands_2024_01.arc")
+    write_archive(path, [row])
+    
+    with pytest.raises(FileExistsError):
+        write_archive(path, [make_row()])
+    
+    def failing_rows():
+        yield make_row()
+        raise RuntimeError("export failed")
+    
+    with pytest.raises(RuntimeError):
+        write_archive(str(tmp_path / "hands_2024_02.arc"), failing_rows())
+    
+    archive = HandArchive(path)
+    assert archive.find(Hand.from_dict(row).id)["id"] == row["id"]
+    archive.close()
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["hands_2024_01.arc"]
+
+
+def test_empty_archive(tmp_path):
+    """Test an archive of an empty partition is valid."""
+    path = str(tmp_path / "hands_2024_02.arc")
+    assert write_archive(path, []) == 0
+    
+    archive = HandArchive(path)
+    assert len(archive) == 0
+    assert archive.find(uuid4()) is None
+    archive.close()
+
+
+def test_rejects_other_files(tmp_path):
+    """Test a file that is not an archive is rejected."""
+    path = tmp_path / "hands_2024_03.arc"
+    path.write_bytes(b"\0" * 64)
+    
+    with pytest.raises(ValueError):
+        HandArchive(str(path))
+
+
+def test_store_searches_every_archive(tmp_path):
+    """Test the store finds rows in any archive of its directory."""
+    january = make_row()
+    write_archive(str(tmp_path / "hands_2024_01.arc"), [january])
+    store = ArchiveStore(str(tmp_path))
+    assert store.find(Hand.from_dict(january).id)["id"] == january["id"]
+    
+    # Archives written after the store was opened are picked up too
+    february = make_row()
+    write_archive(str(tmp_path / "hands_2024_02.arc"), [february])
+    assert store.find(Hand.from_dict(february).id)["id"] == february["id"]
+    assert store.find(uuid4()) is None
+    store.close()
+    
+    assert ArchiveStore(str(tmp_path / "missing")).find(uuid4()) is None
+
+
+def test_archive_partition(postgres_repository, tmp_path):
+    """Test an archived partition leaves the table but stays findable by ID."""
+    from src.database.archive import archive_partition
+    from src.database.connection import get_db_connection
+    from src.database.partitions import ensure_partition, list_partitions
+    from src.repository.hand_repository import HandRepository
+    
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    name = ensure_partition(cursor, datetime(2001, 1, 1))
+    cursor.execute(
+        """
+        INSERT INTO hands (
+            id, stacks, dealer_position, small_blind_position, big_blind_position,
+            hole_cards, actions, board_cards, payoffs, created_at
+        ) VALUES (%s, '[1000, 1000, 1000, 1000, 1000, 1000]', 0, 1, 2,
+                  '["AsKd", "2h3c", "7h8h", "QsQd", "JhTh", "9s9c"]', 'f,f,f,f,f', '',
+                  '[-20, 20, 0, 0, 0, 0]', '2001-01-10')
+        """,
+        (str(hand_id := uuid4()),),
+    )
+    conn.commit()
+    
+    assert archive_partition(conn, name, str(tmp_path)) == 1
+    
+    assert name not in [partition.name for partition in list_partitions(cursor)]
+    hand = HandRepository(archive_dir=str(tmp_path)).find_by_id(hand_id)
+    assert hand is not None and hand.payoffs == [-20, 20, 0, 0, 0, 0]
+    cursor.close()
@@ -0,0 +1,98 @@
+import pytest
+
+from src.database.backfill import BACKFILLS, run_backfill
+from src.domain.hand_metrics import derive_hand_metrics
+from tests.conftest import make_hand
+
+
+def fetch_metrics(hand_id):
+    """Read the derived columns of a hand."""
+    from src.database.connection import get_db_connection
+    
+    cursor = get_db_connection().cursor()
+    cursor.execute(
+        """
+        SELECT pot_size, street_reached, winner_seats, action_opcodes, went_to_showdown
+        FROM hands WHERE id = %s
+        """,
+        (str(hand_id),),
+    )
+    row = cursor.fetchone()
+    cursor.close()
+    return dict(zip([column for column, _ in BACKFILLS["hand_metrics"].columns], row))
+
+
+def make_hands(count):
+    """Build hands that fold around to the big blind."""
+    return [make_hand() for _ in range(count)]
+
+
+def clear_metrics(hands):
+    """Null the derived columns, as for hands saved before they existed."""
+    from src.database.connection import get_db_connection
+    
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    cursor.execute(
+        """
+        UPDATE hands
+        SET pot_size = NULL, street_reached = NULL, winner_seats = NULL,
+            action_opcodes = NULL, went_to_showdown = NULL
+        WHERE id = ANY(%s::uuid[])
+        """,
+        ([str(hand.id) for hand in hands],),
+    )
+    conn.commit()
+    cursor.close()
+
+
+def test_save_writes_metrics(postgres_repository):
+    """Test newly saved hands get their derived columns without a backfill."""
+    hand, batched = make_hands(2)
+    postgres_repository.save(hand)
+    postgres_repository.save_many([batched])
+    
+    assert fetch_metrics(hand.id) == derive_hand_metrics(hand)
+    assert fetch_metrics(batched.id) == derive_hand_metrics(batched)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_backfill_hand_metrics(postgres_repository, workers):
+    """Test every pending hand gets its derived columns written."""
+    hands = make_hands(25)
+    postgres_repository.save_many(hands)
+    clear_metrics(hands)
+    
+    reports = []
+    progress = run_backfill(
+        "hand_metrics", workers=workers, chunk_size=10, restart=True, on_progress=reports.append
+    )
+    
+    assert progress.rows == len(hands)
+    assert reports
+    for hand in hands:
+        assert fetch_metrics(hand.id) == derive_hand_metrics(hand)
+
+
+def test_resume_sweeps_rows_below_checkpoint(postgres_repository):
+    """Test a resumed backfill also fills rows inserted below its checkpoint."""
+    from src.database.backfill import _save_checkpoint
+    from src.database.connection import get_db_connection
+    
+    hands = sorted(make_hands(6), key=lambda hand: hand.id)
+    postgres_repository.save_many(hands)
+    clear_metrics(hands)
+    
+    # Interrupted after the third hand; the first two were inserted later
+    _save_checkpoint(get_db_connection(), "hand_metrics", str(hands[2].id), 1)
+    progress = run_backfill("hand_metrics", workers=1, chunk_size=2)
+    
+    assert progress.rows == len(hands)
+    for hand in hands:
+        assert fetch_metrics(hand.id) == derive_hand_metrics(hand)
+
+
+def test_unknown_backfill():
+    """Test an unknown backfill name is rejected."""
+    with pytest.raises(ValueError):
+        run_backfill("missing")
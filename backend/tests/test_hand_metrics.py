@@ -0,0 +1,93 @@
+from src.domain.hand import Hand
+from src.domain.hand_metrics import (
+    action_opcodes,
+    derive_hand_metrics,
+    pot_size,
+    street_reached,
+    went_to_showdown,
+    winner_seats,
+)
+
+
+def test_walk_preflop():
+    """Test metrics for a hand folded around to the big blind."""
+    hand = Hand(stacks=[1000] * 6, actions="f,f,f,f,f", payoffs=[-20, 20, 0, 0, 0, 0])
+    
+    assert derive_hand_metrics(hand) == {
+        "pot_size": 40,
+        "street_reached": "preflop",
+        "winner_seats": [1],
+        "action_opcodes": "fffff",
+        "went_to_showdown": False,
+    }
+
+
+def test_split_pot_at_showdown():
+    """Test metrics for a hand played to the river with a split pot."""
+    hand = Hand(
+        stacks=[1000] * 6,
+        actions="c,f,f,f,c,x,flop:2c3d4h,x,b100,r300,c,c,turn:5s,x,x,x,river:6d,allin,c,f",
+        payoffs=[170, 170, -340, 0, 0, 0],
+    )
+    
+    assert pot_size(hand) == 2340
+    assert street_reached(hand) == "river"
+    assert winner_seats(hand) == [0, 1]
+    assert action_opcodes(hand) == "cfffcx/xbrcc/xxx/acf"
+    assert went_to_showdown(hand) is True
+
+
+def test_all_in_runout_returns_uncalled_chips():
+    """Test a short-stacked all-in only counts the matched chips."""
+    hand = Hand(
+        stacks=[1000, 500, 1000, 1000, 1000, 1000],
+        actions="r200,f,f,f,c,allin,c,f,flop:2c3d4h,turn:5s,river:6d",
+        payoffs=[-200, -500, 700, 0, 0, 0],
+    )
+    
+    assert pot_size(hand) == 1200
+    assert action_opcodes(hand) == "rfffcacf///"
+    assert went_to_showdown(hand) is True
+
+
+def test_unfinished_hand_is_not_a_showdown():
+    """Test a hand stored before the flop was dealt is not a showdown."""
+    hand = Hand(stacks=[1000] * 6, actions="c,c,c,c,c,x", payoffs=[-20, -40, -40, -40, -40, -40])
+    
+    assert street_reached(hand) == "preflop"
+    assert went_to_showdown(hand) is False
+
+
+def test_all_in_before_the_river_is_a_showdown():
+    """Test players all-in before the board is dealt reach a showdown."""
+    hand = Hand(
+        stacks=[1000, 500, 1000, 1000, 1000, 1000],
+        actions="f,f,f,f,allin,c",
+        payoffs=[500, -500, 0, 0, 0, 0],
+    )
+    
+    assert went_to_showdown(hand) is True
+
+
+def test_unfinished_river_betting_is_not_a_showdown():
+    """Test a hand stopped during the river betting is not a showdown."""
+    actions = "c,c,c,c,c,x,flop:2c3d4h,x,x,x,x,x,x,turn:5s,x,x,x,x,x,x,river:6d"
+    
+    for unfinished in (actions, actions + ",b100", actions + ",b100,c,c"):
+        hand = Hand(stacks=[1000] * 6, actions=unfinished, payoffs=[-40] * 6)
+        assert street_reached(hand) == "river"
+        assert went_to_showdown(hand) is False
+    
+    finished = Hand(
+        stacks=[1000] * 6,
+        actions=actions + ",b100,c,c,f,f,c",
+        payoffs=[-140, -140, 500, -40, -40, -140],
+    )
+    assert went_to_showdown(finished) is True
+
+
+def test_uncalled_all_in_is_not_a_showdown():
+    """Test an all-in still waiting for a call is not a showdown."""
+    hand = Hand(stacks=[1000] * 6, actions="f,f,f,f,allin", payoffs=[-20, -40, 0, 0, 0, 0])
+    
+    assert went_to_showdown(hand) is False
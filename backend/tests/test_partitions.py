@@ -0,0 +1,53 @@
+from datetime import datetime, timezone
+from uuid import UUID, uuid4
+
+from src.database.partitions import (
+    add_months,
+    current_month,
+    month_start,
+    parse_partition_bound,
+    partition_name,
+)
+from src.domain.hand import Hand, hand_id_timestamp, new_hand_id
+
+
+def test_month_helpers():
+    """Test month arithmetic across year boundaries."""
+    month = month_start(datetime(2024, 11, 17, 13, 45, 12, 5))
+    
+    assert month == datetime(2024, 11, 1)
+    assert add_months(month, 2) == datetime(2025, 1, 1)
+    assert add_months(month, -11) == datetime(2023, 12, 1)
+    assert partition_name(month) == "hands_2024_11"
+    assert current_month(datetime(2024, 2, 29, 23, 59)) == datetime(2024, 2, 1)
+
+
+def test_hand_ids_are_time_ordered():
+    """Test new hand IDs are version 7 UUIDs that encode their creation time."""
+    before = datetime.now(timezone.utc).replace(tzinfo=None, microsecond=0)
+    ids = [Hand().id for _ in range(100)]
+    
+    assert all(hand_id.version == 7 for hand_id in ids)
+    assert len(set(ids)) == len(ids)
+    assert hand_id_timestamp(ids[0]) >= before
+    assert hand_id_timestamp(new_hand_id()) >= hand_id_timestamp(ids[-1])
+
+
+def test_random_ids_have_no_timestamp():
+    """Test version 4 IDs do not claim a creation time."""
+    assert hand_id_timestamp(uuid4()) is None
+
+
+def test_far_future_ids_and_months():
+    """Test IDs and months past year 9999 do not raise."""
+    assert hand_id_timestamp(UUID("ffffffff-ffff-7fff-bfff-ffffffffffff")) is None
+    assert add_months(datetime(9999, 12, 1), 1) == datetime.max
+    assert add_months(datetime(1, 1, 1), -1) == datetime.min
+
+
+def test_parse_partition_bound():
+    """Test range bounds are parsed and default partitions are ignored."""
+    assert parse_partition_bound(
+        "FOR VALUES FROM ('2023-07-01 00:00:00') TO ('2024-02-01 00:00:00')"
+    ) == (datetime(2023, 7, 1), datetime(2024, 2, 1))
+    assert parse_partition_bound("DEFAULT") is None
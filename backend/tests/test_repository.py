@@ -0,0 +1,89 @@
+import time
+
+import pytest
+from uuid import uuid4
+
+from src.repository.sqlite_hand_repository import SqliteHandRepository
+from tests.conftest import make_hand
+
+
+@pytest.fixture(params=["sqlite", "postgres"])
+def repository(request, tmp_path):
+    """Yield each repository backend; PostgreSQL is skipped when unreachable."""
+    if request.param == "postgres":
+        yield request.getfixturevalue("postgres_repository")
+        return
+    
+    repo = SqliteHandRepository(str(tmp_path / "hands.db"))
+    yield repo
+    repo.close()
+
+
+def test_save_and_find_by_id(repository):
+    """Test a saved hand round-trips through the backend."""
+    hand = make_hand(board_cards="5c6c7c8d9s")
+    repository.save(hand)
+    
+    found = repository.find_by_id(hand.id)
+    assert found == hand
+
+
+def test_find_by_id_missing(repository):
+    """Test looking up an unknown ID returns None."""
+    assert repository.find_by_id(uuid4()) is None
+
+
+def test_find_all_newest_first(repository):
+    """Test find_all returns the most recently saved hands first."""
+    first = repository.save(make_hand())
+    time.sleep(0.01)
+    second = repository.save(make_hand())
+    
+    hands = repository.find_all(limit=2)
+    assert [hand.id for hand in hands] == [second.id, first.id]
+
+
+def test_save_many(repository):
+    """Test saving a batch of hands."""
+    hands = [make_hand(payoffs=[i, -i, 0, 0, 0, 0]) for i in range(10)]
+    assert repository.save_many(hands) == hands
+    assert repository.save_many([]) == []
+    
+    for hand in hands:
+        assert repository.find_by_id(hand.id) == hand
+
+
+def test_bulk_insert_and_read_performance(repository, record_property):
+    """Test bulk inserts and reads, reporting their timings rather than enforcing them."""
+    hands = [make_hand() for _ in range(5000)]
+    
+    start = time.perf_counter()
+    repository.save_many(hands)
+    insert_seconds = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    for hand in hands[::50]:
+        assert repository.find_by_id(hand.id) is not None
+    assert len(repository.find_all(limit=1000)) == 1000
+    read_seconds = time.perf_counter() - start
+    
+    record_property("bulk_insert_seconds", round(insert_seconds, 4))
+    record_property("read_seconds", round(read_seconds, 4))
+    print(f"{type(repository).__name__}: insert {insert_seconds:.3f}s, read {read_seconds:.3f}s")
+
+
+def test_sqlite_readers_do_not_wait_for_writer(tmp_path):
+    """Test SQLite reads proceed while the writer holds its lock."""
+    import threading
+    
+    repo = SqliteHandRepository(str(tmp_path / "hands.db"))
+    hand = repo.save(make_hand())
+    found = []
+    
+    with repo._write_lock:
+        reader = threading.Thread(target=lambda: found.append(repo.find_by_id(hand.id)))
+        reader.start()
+        reader.join(timeout=5)
+    
+    assert found == [hand]
+    repo.close()